@@ -2,27 +2,42 @@ import re
 import json
 
 
+PHONE_PATTERN = re.compile(r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$')
+
+
 class Client:
 
+    FIELD_RULES = (
+        ("surname", "Surname", {"is_required": True, "only_letters": True}),
+        ("name", "Name", {"is_required": True, "only_letters": True}),
+        ("patronymic", "Patronymic", {"is_required": False, "only_letters": True}),
+        ("address", "Address", {"is_required": True}),
+        ("phone", "Phone", {"is_required": True, "regex": PHONE_PATTERN}),
+    )
+
+    __slots__ = ("__surname", "__name", "__patronymic", "__address", "__phone")
 
     def __init__(self, surname, name, patronymic, address, phone):
-        self.surname = self.validate_value(surname, "Surname", is_required=True, only_letters=True)
-        self.name = self.validate_value(name, "Name", is_required=True, only_letters=True)
-        self.patronymic = self.validate_value(patronymic, "Patronymic", is_required=False, only_letters=True)
-        self.address = self.validate_value(address, "Address", is_required=True)
-        self.phone = self.validate_value(phone, "Phone", is_required=True, regex=r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$')
+        values = (surname, name, patronymic, address, phone)
+        for value, (attr, field_name, rules) in zip(values, self.FIELD_RULES):
+            setattr(self, attr, self.validate_value(value, field_name, **rules))
 
     @staticmethod
     def validate_value(value, field_name, is_required=True, only_letters=False, regex=None):
 
-        if is_required and not value.strip():
-            raise ValueError(f"{field_name} cannot be empty.")
+        if not value.strip():
+            if is_required:
+                raise ValueError(f"{field_name} cannot be empty.")
+            return value
 
         if only_letters and not value.replace(' ', '').isalpha():
             raise ValueError(f"{field_name} must contain only letters.")
 
-        if regex and not re.match(regex, value):
-            raise ValueError(f"{field_name} is invalid. Expected format: {regex}")
+        if isinstance(regex, str):
+            regex = re.compile(regex)
+
+        if regex and not regex.match(value):
+            raise ValueError(f"{field_name} is invalid. Expected format: {regex.pattern}")
 
         return value
 
@@ -33,18 +48,7 @@ class Client:
         if len(fields) != 5:
             raise ValueError("Data string must contain exactly 5 fields separated by the delimiter.")
 
-        validated_fields = [
-            cls.validate_value(field.strip(), field_name, **validation_rules)
-            for field, (field_name, validation_rules) in zip(fields, [
-                ("Surname", {"is_required": True, "only_letters": True}),
-                ("Name", {"is_required": True, "only_letters": True}),
-                ("Patronymic", {"is_required": False, "only_letters": True}),
-                ("Address", {"is_required": True}),
-                ("Phone", {"is_required": True, "regex": r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$'}),
-            ])
-        ]
-
-        return cls(*validated_fields)
+        return cls(*(field.strip() for field in fields))
 
     @classmethod
     def from_json(cls, json_string):
@@ -54,26 +58,7 @@ class Client:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
 
-        required_keys = [
-            ("surname", "Surname", {"is_required": True, "only_letters": True}),
-            ("name", "Name", {"is_required": True, "only_letters": True}),
-            ("patronymic", "Patronymic", {"is_required": False, "only_letters": True}),
-            ("address", "Address", {"is_required": True}),
-            ("phone", "Phone", {"is_required": True, "regex": r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$'}),
-        ]
-
-        validated_data = {
-            key: cls.validate_value(data.get(key, "").strip(), field_name, **validation_rules)
-            for key, field_name, validation_rules in required_keys
-        }
-
-        return cls(
-            surname=validated_data["surname"],
-            name=validated_data["name"],
-            patronymic=validated_data["patronymic"],
-            address=validated_data["address"],
-            phone=validated_data["phone"]
-        )
+        return cls(*(data.get(attr, "").strip() for attr, _, _ in cls.FIELD_RULES))
 
     def __str__(self):
 
@@ -144,6 +129,8 @@ class Client:
 
 
 class ShortClient:
+    __slots__ = ("_base",)
+
     def __init__(self, base_client):
         if not isinstance(base_client, Client):
             raise ValueError("Expected an instance of Client.")
@@ -1,30 +1,94 @@
 import re
 import os
+import io
 import json
+import hashlib
+import pickle
+import mmap
+import struct
+import textwrap
 import yaml
+from collections import OrderedDict
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from bisect import bisect_left, insort
+from itertools import compress, count, islice
+from operator import itemgetter
+import threading
+import weakref
+import time
 import psycopg2
+import psycopg2.pool
+import psycopg2.extras
+from psycopg2 import sql
+
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+JSON_SEPARATORS = re.compile(r'[\s,]*')
+BINARY_HEADER = struct.Struct('<4sH')
+BINARY_MAGIC = b'CLRB'
+BINARY_VERSION = 1
+BINARY_RECORD = struct.Struct('<Iq')
+BINARY_FIELD = struct.Struct('<H')
+BINARY_INDEX_ENTRY = struct.Struct('<qQ')
+JSONL_INDEX_HEADER = struct.Struct('<Q')
+JSONL_INDEX_ENTRY = struct.Struct('<qQI')
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+PHONE_PATTERN = re.compile(r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$')
 
 class Client:
+    FIELD_RULES = (
+        ("surname", "Surname", {"is_required": True, "only_letters": True}),
+        ("name", "Name", {"is_required": True, "only_letters": True}),
+        ("patronymic", "Patronymic", {"is_required": False, "only_letters": True}),
+        ("address", "Address", {"is_required": True}),
+        ("phone", "Phone", {"is_required": True, "regex": PHONE_PATTERN}),
+    )
+
+    __slots__ = ("surname", "name", "patronymic", "address", "phone", "__client_id")
+
     def __init__(self, surname, name, patronymic, address, phone, client_id=None):
-        self.surname = self.validate_value(surname, "Surname", is_required=True, only_letters=True)
-        self.name = self.validate_value(name, "Name", is_required=True, only_letters=True)
-        self.patronymic = self.validate_value(patronymic, "Patronymic", is_required=False, only_letters=True)
-        self.address = self.validate_value(address, "Address", is_required=True)
-        self.phone = self.validate_value(phone, "Phone", is_required=True, regex=r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$')
+        values = (surname, name, patronymic, address, phone)
+        for value, (attr, field_name, rules) in zip(values, self.FIELD_RULES):
+            setattr(self, attr, self.validate_value(value, field_name, **rules))
 
         if client_id is None:
             self.client_id = None
         else:
             self.client_id = client_id
 
+    @classmethod
+    def _from_validated(cls, surname, name, patronymic, address, phone, client_id=None):
+        client = cls.__new__(cls)
+        client.surname = surname
+        client.name = name
+        client.patronymic = patronymic
+        client.address = address
+        client.phone = phone
+        client.client_id = client_id
+        return client
+
     @staticmethod
     def validate_value(value, field_name, is_required=True, only_letters=False, regex=None):
-        if is_required and not value.strip():
-            raise ValueError(f"{field_name} cannot be empty.")
+        if not value.strip():
+            if is_required:
+                raise ValueError(f"{field_name} cannot be empty.")
+            return value
         if only_letters and not value.replace(' ', '').isalpha():
             raise ValueError(f"{field_name} must contain only letters.")
-        if regex and not re.match(regex, value):
-            raise ValueError(f"{field_name} is invalid. Expected format: {regex}")
+        if isinstance(regex, str):
+            regex = re.compile(regex)
+        if regex and not regex.match(value):
+            raise ValueError(f"{field_name} is invalid. Expected format: {regex.pattern}")
         return value
 
     @property
@@ -51,22 +115,24 @@ class Client:
             "client_id": self.client_id
         }
 
+    @classmethod
+    def from_dict(cls, data, validate=True):
+        constructor = cls if validate else cls._from_validated
+        return constructor(
+            surname=data["surname"],
+            name=data["name"],
+            patronymic=data.get("patronymic", ""),
+            address=data["address"],
+            phone=data["phone"],
+            client_id=data.get("client_id", None)
+        )
+
     @classmethod
     def from_string(cls, data_string, delimiter=","):
         fields = data_string.split(delimiter)
         if len(fields) != 5:
             raise ValueError("Data string must contain exactly 5 fields separated by the delimiter.")
-        validated_fields = [
-            cls.validate_value(field.strip(), field_name, **validation_rules)
-            for field, (field_name, validation_rules) in zip(fields, [
-                ("Surname", {"is_required": True, "only_letters": True}),
-                ("Name", {"is_required": True, "only_letters": True}),
-                ("Patronymic", {"is_required": False, "only_letters": True}),
-                ("Address", {"is_required": True}),
-                ("Phone", {"is_required": True, "regex": r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$'}),
-            ])
-        ]
-        return cls(*validated_fields)
+        return cls(*(field.strip() for field in fields))
 
     def __str__(self):
         return (
@@ -81,193 +147,1276 @@ class Client:
     def __repr__(self):
         return f"Client({self.name} {self.surname})"
 
+    def __eq__(self, other):
+        if not isinstance(other, Client):
+            return NotImplemented
+        return (
+                self.surname == other.surname and
+                self.name == other.name and
+                self.patronymic == other.patronymic and
+                self.address == other.address and
+                self.phone == other.phone
+        )
 
-class ClientRepJson:
-    def __init__(self, file_name):
-        self.file_name = file_name
-        self.clients = self.read_all()
+    def __hash__(self):
+        return hash((self.surname, self.name, self.patronymic, self.address, self.phone))
+
+
+class ShortClient:
+    __slots__ = ("surname", "name", "client_id", "sort_key")
+
+    def __init__(self, surname, name, client_id=None, sort_key=None):
+        self.surname = surname
+        self.name = name
+        self.client_id = client_id
+        self.sort_key = sort_key
+
+    def get_client_id(self):
+        return self.client_id
+
+    def __str__(self):
+        return f"{self.name} {self.surname}"
+
+    def __repr__(self):
+        return f"ShortClient({self.name} {self.surname})"
+
+
+class ClientBatch:
+    COLUMNS = ("surname", "name", "patronymic", "address", "phone", "client_id")
+
+    def __init__(self, surname=(), name=(), patronymic=(), address=(), phone=(), client_id=None):
+        self.surname = list(surname)
+        self.name = list(name)
+        self.patronymic = ["" if value is None else value for value in patronymic]
+        self.address = list(address)
+        self.phone = list(phone)
+        self.client_id = [None] * len(self.surname) if client_id is None else list(client_id)
+        if len({len(getattr(self, column)) for column in self.COLUMNS}) > 1:
+            raise ValueError("All columns of a client batch must have the same length.")
+
+    @classmethod
+    def from_dicts(cls, rows):
+        batch = cls()
+        for row in rows:
+            patronymic = row.get("patronymic")
+            batch.surname.append(row.get("surname"))
+            batch.name.append(row.get("name"))
+            batch.patronymic.append("" if patronymic is None else patronymic)
+            batch.address.append(row.get("address"))
+            batch.phone.append(row.get("phone"))
+            batch.client_id.append(row.get("client_id", None))
+        return batch
+
+    @classmethod
+    def from_clients(cls, clients):
+        return cls.from_dicts(client.to_dict() for client in clients)
+
+    def __len__(self):
+        return len(self.surname)
+
+    def select(self, rows):
+        if len(rows) == len(self):
+            return self
+        return ClientBatch(**{column: [getattr(self, column)[i] for i in rows] for column in self.COLUMNS})
+
+    def iter_rows(self):
+        return zip(self.surname, self.name, self.patronymic, self.address, self.phone)
+
+    @staticmethod
+    def check_column(column, field_name, is_required=True, only_letters=False, regex=None):
+        errors = [None] * len(column)
+        texts = [isinstance(value, str) for value in column]
+        filled = [text and bool(value.strip()) for value, text in zip(column, texts)]
+        for i in compress(range(len(column)), [value is not None and not text for value, text in zip(column, texts)]):
+            errors[i] = f"{field_name} must be text."
+        if is_required:
+            empty = [(value is None or text) and not f for value, text, f in zip(column, texts, filled)]
+            for i in compress(range(len(column)), empty):
+                errors[i] = f"{field_name} cannot be empty."
+        if only_letters:
+            letters = [f and value.replace(' ', '').isalpha() for value, f in zip(column, filled)]
+            for i in compress(range(len(column)), [f and not ok for f, ok in zip(filled, letters)]):
+                errors[i] = f"{field_name} must contain only letters."
+        if regex:
+            matched = [f and regex.match(value) for value, f in zip(column, filled)]
+            for i in compress(range(len(column)), [f and not m for f, m in zip(filled, matched)]):
+                errors[i] = f"{field_name} is invalid. Expected format: {regex.pattern}"
+        return errors
+
+    def validate(self):
+        errors = [None] * len(self)
+        for attr, field_name, rules in Client.FIELD_RULES:
+            column_errors = self.check_column(getattr(self, attr), field_name, **rules)
+            errors = [error or column_error for error, column_error in zip(errors, column_errors)]
+        return errors
+
+    def to_clients(self, rows=None):
+        if rows is None:
+            rows = range(len(self))
+        return [
+            Client._from_validated(self.surname[i], self.name[i], self.patronymic[i], self.address[i],
+                                   self.phone[i], self.client_id[i])
+            for i in rows
+        ]
 
+class ClientRepository(ABC):
+    def __init__(self, lazy=False):
+        self.in_batch = False
+        self.pending = []
+        self.last_id = self.read_last_id()
+        self._clients = None
+        self._index = None
+        self.tombstones = 0
+        self.reset_secondary_indexes()
+        if not lazy:
+            self.load()
+
+    @property
+    def clients(self):
+        if self._clients is None:
+            self.load()
+        elif self.tombstones:
+            self.compact()
+        return self._clients
+
+    @clients.setter
+    def clients(self, value):
+        self._clients = value
+        self.tombstones = 0
+
+    @property
+    def index(self):
+        if self._clients is None:
+            self.load()
+        return self._index
+
+    @index.setter
+    def index(self, value):
+        self._index = value
+
+    def load(self):
+        self._clients = self.read_all()
+        self.tombstones = 0
+        self.rebuild_index()
+        self.reset_secondary_indexes()
+        self.last_id = max([self.last_id] + list(self._index))
+
+    def sync_last_id(self):
+        if self._clients is None:
+            self.load()
+
+    def can_stream(self):
+        return False
+
+    def iter_clients(self, chunk_size=None):
+        return iter(self.clients)
+
+    def iter_records(self, chunk_size=None):
+        for client in self.iter_clients(chunk_size):
+            yield client.to_dict()
+
+    @abstractmethod
     def read_all(self):
-        try:
-            with open(self.file_name, 'r') as file:
-                data = json.load(file)
-                clients = []
-                for client_data in data:
-                    client_id = client_data.get("client_id", None)
-                    client = Client(
-                        surname=client_data["surname"],
-                        name=client_data["name"],
-                        patronymic=client_data.get("patronymic", ""),
-                        address=client_data["address"],
-                        phone=client_data["phone"],
-                        client_id=client_id
-                    )
-                    clients.append(client)
-                return clients
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            print(f"Error: The file '{self.file_name}' is not a valid JSON.")
-            return []
+        pass
 
+    @abstractmethod
     def save_all(self):
-        data = []
-        for client in self.clients:
-            client_data = client.to_dict()
-            if client_data["client_id"] is None:
-                client_data["client_id"] = self.get_new_client_id()
-            data.append(client_data)
-        with open(self.file_name, 'w') as file:
-            json.dump(data, file, indent=4)
+        pass
+
+    def persist(self, records):
+        self.save_all()
+
+    def write_change(self, record):
+        if self.in_batch:
+            self.pending.append(record)
+            return
+        self.persist([record])
+
+    def assign_missing_ids(self):
+        for i, client in enumerate(self.clients):
+            if client.get_client_id() is None:
+                client.client_id = self.get_new_client_id()
+                self.index[client.client_id] = i
+                self.reset_secondary_indexes()
+        self.save_last_id()
+
+    def reset_secondary_indexes(self):
+        self.indexed_keys = None
+        self.phone_index = None
+        self.name_index = None
+        self.search_index = None
+
+    def ensure_secondary_indexes(self):
+        if self.phone_index is not None:
+            return
+        indexed_keys = {
+            client.get_client_id(): self.index_keys(client) for client in self.clients if client.get_client_id() is not None
+        }
+        phone_index = {}
+        for client_id, (phone, _, _) in indexed_keys.items():
+            phone_index.setdefault(phone, []).append(client_id)
+        self.name_index = sorted(name_key for _, name_key, _ in indexed_keys.values())
+        self.search_index = sorted(key for _, _, search_keys in indexed_keys.values() for key in search_keys)
+        self.indexed_keys = indexed_keys
+        self.phone_index = phone_index
+
+    @staticmethod
+    def index_keys(client):
+        client_id = client.get_client_id()
+        search_keys = frozenset(
+            (token.casefold(), client_id) for token in (client.surname, client.name, client.patronymic) if token
+        )
+        return client.phone, (client.surname, client.name, client_id), search_keys
+
+    def index_client(self, client):
+        if self.phone_index is None or client.get_client_id() is None:
+            return
+        phone, name_key, search_keys = self.indexed_keys[client.get_client_id()] = self.index_keys(client)
+        self.phone_index.setdefault(phone, []).append(client.get_client_id())
+        insort(self.name_index, name_key)
+        for key in search_keys:
+            insort(self.search_index, key)
+
+    def unindex_client(self, client_id):
+        if self.phone_index is None or client_id not in self.indexed_keys:
+            return
+        phone, name_key, search_keys = self.indexed_keys.pop(client_id)
+        client_ids = self.phone_index[phone]
+        client_ids.remove(client_id)
+        if not client_ids:
+            del self.phone_index[phone]
+        for keys, key in [(self.name_index, name_key)] + [(self.search_index, key) for key in search_keys]:
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+
+    def find_by_phone(self, phone):
+        if self.can_stream():
+            return [client for client in self.iter_clients() if client.phone == phone]
+        self.ensure_secondary_indexes()
+        return [self.get_by_id(client_id) for client_id in self.phone_index.get(phone, [])]
+
+    def find_by_surname(self, prefix, limit=None):
+        if self.can_stream():
+            clients = sorted(
+                (client for client in self.iter_clients() if client.surname.startswith(prefix)),
+                key=lambda client: (client.surname, client.name, client.get_client_id())
+            )
+            return clients[:limit]
+        self.ensure_secondary_indexes()
+        clients = []
+        i = bisect_left(self.name_index, (prefix,))
+        while i < len(self.name_index) and self.name_index[i][0].startswith(prefix):
+            if limit is not None and len(clients) >= limit:
+                break
+            clients.append(self.get_by_id(self.name_index[i][2]))
+            i += 1
+        return clients
+
+    def search_prefix(self, prefix, limit=10):
+        prefix = prefix.casefold()
+        if self.can_stream():
+            matches = []
+            for client in self.iter_clients():
+                tokens = [key[0] for key in self.index_keys(client)[2] if key[0].startswith(prefix)]
+                if tokens:
+                    matches.append((min(tokens), client.get_client_id(), client))
+            matches.sort(key=lambda match: match[:2])
+            return [match[2] for match in matches[:limit]]
+        self.ensure_secondary_indexes()
+        clients = []
+        seen = set()
+        i = bisect_left(self.search_index, (prefix,))
+        while i < len(self.search_index) and self.search_index[i][0].startswith(prefix):
+            if limit is not None and len(clients) >= limit:
+                break
+            client_id = self.search_index[i][1]
+            if client_id not in seen:
+                seen.add(client_id)
+                clients.append(self.get_by_id(client_id))
+            i += 1
+        return clients
+
+    def find_by_surname_range(self, start, end):
+        if self.can_stream():
+            return sorted(
+                (client for client in self.iter_clients() if start <= client.surname < end),
+                key=lambda client: (client.surname, client.name, client.get_client_id())
+            )
+        self.ensure_secondary_indexes()
+        i = bisect_left(self.name_index, (start,))
+        j = bisect_left(self.name_index, (end,))
+        return [self.get_by_id(key[2]) for key in self.name_index[i:j]]
+
+    def compact(self):
+        self._clients = [client for client in self._clients if client is not None]
+        self.tombstones = 0
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        self.index = {}
+        for i in range(len(self.clients)):
+            client_id = self.clients[i].get_client_id()
+            if client_id is not None:
+                self.index[client_id] = i
 
     def get_by_id(self, client_id):
-        for client in self.clients:
-            if client.get_client_id() == client_id:
-                return client
-        raise ValueError(f"Client with ID {client_id} not found")
+        if self.can_stream():
+            for client in self.iter_clients():
+                if client.get_client_id() == client_id:
+                    return client
+            raise ValueError(f"Client with ID {client_id} not found")
+        i = self.index.get(client_id)
+        if i is None:
+            raise ValueError(f"Client with ID {client_id} not found")
+        return self._clients[i]
 
     def get_k_n_short_list(self, k, n):
         start = (k - 1) * n
         end = start + n
+        if self.can_stream():
+            return list(islice(self.iter_clients(), start, end))
         return self.clients[start:end]
 
     def sort_by_field(self, field="client_id"):
         self.clients.sort(key=lambda client: getattr(client, field))
+        self.rebuild_index()
 
     def add_client(self, surname, name, patronymic, address, phone):
         new_id = self.get_new_client_id()
         new_client = Client(surname, name, patronymic, address, phone, new_id)
-        self.clients.append(new_client)
-        self.save_all()
+        index = self.index
+        index[new_id] = len(self._clients)
+        self._clients.append(new_client)
+        self.index_client(new_client)
+        self.write_change({"op": "add", "client": new_client.to_dict()})
+
+    def add_clients(self, clients):
+        new_ids = []
+        self.reset_secondary_indexes()
+        with self.batch():
+            for client in clients:
+                if client.get_client_id() is None:
+                    client.client_id = self.get_new_client_id()
+                elif client.get_client_id() in self.index:
+                    raise ValueError(f"Client with ID {client.get_client_id()} already exists")
+                else:
+                    self.sync_last_id()
+                    self.last_id = max(self.last_id, client.get_client_id())
+                self.clients.append(client)
+                self.index[client.get_client_id()] = len(self.clients) - 1
+                self.write_change({"op": "add", "client": client.to_dict()})
+                new_ids.append(client.get_client_id())
+        return new_ids
+
+    def add_batch(self, batch):
+        errors = batch.validate()
+        rows = [i for i, error in enumerate(errors) if error is None]
+        new_ids = self.add_columns(batch.select(rows))
+        for i, new_id in zip(rows, new_ids):
+            batch.client_id[i] = new_id
+        return errors
+
+    def add_columns(self, batch):
+        return self.add_clients(batch.to_clients())
+
+    def read_all_batch(self):
+        if self.can_stream():
+            return ClientBatch.from_dicts(self.iter_records())
+        return ClientBatch.from_clients(self.clients)
+
+    @contextmanager
+    def batch(self):
+        if self.in_batch:
+            yield self
+            return
+        clients, index, last_id = list(self.clients), dict(self.index), self.last_id
+        self.in_batch = True
+        try:
+            yield self
+        except BaseException:
+            self.clients, self.index, self.last_id = clients, index, last_id
+            self.reset_secondary_indexes()
+            self.pending = []
+            raise
+        finally:
+            self.in_batch = False
+        pending, self.pending = self.pending, []
+        self.persist(pending)
 
     def replace_by_id(self, client_id, new_client):
-        for i, client in enumerate(self.clients):
-            if client.get_client_id() == client_id:
-                self.clients[i] = new_client
-                self.save_all()
-                return True
-        return False
+        i = self.index.get(client_id)
+        if i is None:
+            return False
+        if new_client.get_client_id() is None:
+            new_client.client_id = client_id
+        self.unindex_client(client_id)
+        self._clients[i] = new_client
+        self.index_client(new_client)
+        del self.index[client_id]
+        self.index[new_client.get_client_id()] = i
+        self.write_change({"op": "replace", "client_id": client_id, "client": new_client.to_dict()})
+        return True
 
     def delete_by_id(self, client_id):
-        self.clients = [client for client in self.clients if client.get_client_id() != client_id]
-        self.save_all()
+        i = self.index.pop(client_id, None)
+        if i is not None:
+            self.unindex_client(client_id)
+            self._clients[i] = None
+            self.tombstones += 1
+            if self.tombstones * 2 > len(self._clients):
+                self.compact()
+        self.write_change({"op": "delete", "client_id": client_id})
 
     def get_count(self):
-        return len(self.clients)
+        if self.can_stream():
+            return sum(1 for _ in self.iter_clients())
+        if self._clients is None:
+            self.load()
+        return len(self._clients) - self.tombstones
 
     def get_new_client_id(self):
-        max_id = max([client.get_client_id() for client in self.clients if client.get_client_id() is not None],
-                     default=0)
-        return max_id + 1
+        self.sync_last_id()
+        self.last_id += 1
+        return self.last_id
+
+    def reserve_ids(self, n):
+        self.sync_last_id()
+        first_id = self.last_id + 1
+        self.last_id += n
+        self.save_last_id()
+        return range(first_id, self.last_id + 1)
+
+    def read_last_id(self):
+        return 0
 
-class ClientRepYaml:
-    def __init__(self, file_name):
+    def save_last_id(self):
+        pass
+
+class ClientRepFile(ClientRepository):
+    def __init__(self, file_name, lazy=False):
         self.file_name = file_name
-        self.clients = self.read_all()
+        self.seq_name = file_name + ".seq"
+        super().__init__(lazy)
+
+    def read_last_id(self):
+        try:
+            with open(self.seq_name, 'r') as file:
+                return int(file.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            print(f"Warning: The file '{self.seq_name}' is corrupted. Recomputing the last client ID.")
+            return 0
+
+    def save_last_id(self):
+        with open(self.seq_name, 'w') as file:
+            file.write(str(self.last_id))
+
+class ClientRepAppendFile(ClientRepFile):
+    def can_stream(self):
+        return self._clients is None and not self.pending
+
+    def iter_clients(self, chunk_size=None):
+        if not self.can_stream():
+            return iter(self.clients)
+        return self.stream_clients(chunk_size)
+
+    def iter_records(self, chunk_size=None):
+        if not self.can_stream():
+            return (client.to_dict() for client in self.clients)
+        return self.stream_records(chunk_size)
+
+    def stream_clients(self, chunk_size=None):
+        for client_data in self.stream_records(chunk_size):
+            yield Client.from_dict(client_data, validate=False)
+
+    @abstractmethod
+    def stream_records(self, chunk_size=None):
+        pass
+
+    @abstractmethod
+    def append_rows(self, rows):
+        pass
 
     def read_all(self):
+        return list(self.stream_clients())
+
+    def load(self):
+        super().load()
+        for record in self.pending:
+            client = Client.from_dict(record["client"], validate=False)
+            self._index[client.get_client_id()] = len(self._clients)
+            self._clients.append(client)
+
+    def sync_last_id(self):
+        pass
+
+    @contextmanager
+    def batch(self):
+        if self.in_batch or self._clients is not None:
+            with super().batch():
+                yield self
+            return
+        last_id = self.last_id
+        self.in_batch = True
+        try:
+            yield self
+        except BaseException:
+            self.last_id = last_id
+            self._clients = None
+            self._index = None
+            self.reset_secondary_indexes()
+            self.pending = []
+            raise
+        finally:
+            self.in_batch = False
+        pending, self.pending = self.pending, []
+        self.persist(pending)
+
+    def persist(self, records):
+        if any(record["op"] != "add" for record in records):
+            self.save_all()
+            return
+        row = itemgetter(*ClientBatch.COLUMNS)
+        self.append_rows([row(record["client"]) for record in records])
+        self.save_last_id()
+
+    def add_client(self, surname, name, patronymic, address, phone):
+        if self._clients is not None:
+            return super().add_client(surname, name, patronymic, address, phone)
+        new_client = Client(surname, name, patronymic, address, phone, self.get_new_client_id())
+        self.write_change({"op": "add", "client": new_client.to_dict()})
+
+    def add_columns(self, batch):
+        if self.in_batch or not self.can_stream() or batch.client_id.count(None) < len(batch):
+            return super().add_columns(batch)
+        client_ids = list(self.reserve_ids(len(batch)))
+        self.append_rows(fields + (client_id,) for fields, client_id in zip(batch.iter_rows(), client_ids))
+        return client_ids
+
+
+class ClientRepJson(ClientRepFile):
+    def __init__(self, file_name, journal=False, compact_threshold=1000, lazy=False):
+        self.journal = journal
+        self.journal_name = file_name + ".journal"
+        self.journal_size = 0
+        self.compact_threshold = compact_threshold
+        super().__init__(file_name, lazy)
+
+    def can_stream(self):
+        if self._clients is not None:
+            return False
+        return not (self.journal and os.path.exists(self.journal_name) and os.path.getsize(self.journal_name) > 0)
+
+    def iter_clients(self, chunk_size=65536):
+        if not self.can_stream():
+            yield from self.clients
+            return
+        for client_data in self.iter_records(chunk_size):
+            yield Client.from_dict(client_data, validate=False)
+
+    def iter_records(self, chunk_size=65536):
+        if not self.can_stream():
+            for client in self.clients:
+                yield client.to_dict()
+            return
+        decoder = json.JSONDecoder()
+        try:
+            file = open(self.file_name, 'r')
+        except FileNotFoundError:
+            return
+        with file:
+            buffer = file.read(chunk_size)
+            pos = JSON_SEPARATORS.match(buffer).end()
+            if pos == len(buffer):
+                print(f"Error: The file '{self.file_name}' is not a valid JSON.")
+                return
+            if not buffer.startswith('[', pos):
+                raise ValueError(f"The file '{self.file_name}' does not contain a JSON array.")
+            pos += 1
+            eof = False
+            while True:
+                pos = JSON_SEPARATORS.match(buffer, pos).end()
+                if buffer.startswith(']', pos):
+                    return
+                try:
+                    client_data, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        print(f"Error: The file '{self.file_name}' is not a valid JSON.")
+                        return
+                    chunk = file.read(chunk_size)
+                    eof = not chunk
+                    buffer = buffer[pos:] + chunk
+                    pos = 0
+                    continue
+                yield client_data
+
+    def read_all(self):
+        clients = []
         try:
             with open(self.file_name, 'r') as file:
-                data = yaml.safe_load(file)
-                if data is None:
-                    print(f"Warning: The YAML file is empty or invalid. Returning empty client list.")
-                    return []
-                clients = []
+                data = json.load(file)
                 for client_data in data:
-                    client_id = client_data.get("client_id", None)
-                    client = Client(
-                        surname=client_data["surname"],
-                        name=client_data["name"],
-                        patronymic=client_data.get("patronymic", ""),
-                        address=client_data["address"],
-                        phone=client_data["phone"],
-                        client_id=client_id
-                    )
-                    clients.append(client)
-                return clients
+                    clients.append(Client.from_dict(client_data, validate=False))
         except FileNotFoundError:
-            print(f"Error: The file '{self.file_name}' was not found. Returning empty client list.")
+            pass
+        except json.JSONDecodeError:
+            print(f"Error: The file '{self.file_name}' is not a valid JSON.")
+        if self.journal:
+            clients = self.replay_journal(clients)
+        return clients
+
+    def replay_journal(self, clients):
+        index = {client.get_client_id(): i for i, client in enumerate(clients)}
+        self.journal_size = 0
+        try:
+            file = open(self.journal_name, 'rb+')
+        except FileNotFoundError:
+            return clients
+        with file:
+            offset = end = 0
+            line = b""
+            for line in file:
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"Warning: Skipping incomplete record in '{self.journal_name}'.")
+                    continue
+                end = offset
+                self.journal_size += 1
+                if record["op"] == "add":
+                    client = Client.from_dict(record["client"], validate=False)
+                    self.last_id = max(self.last_id, client.get_client_id())
+                    i = index.get(client.get_client_id())
+                    if i is None or clients[i] is None:
+                        index[client.get_client_id()] = len(clients)
+                        clients.append(client)
+                    else:
+                        clients[i] = client
+                elif record["op"] == "replace":
+                    i = index.pop(record["client_id"], None)
+                    if i is not None and clients[i] is not None:
+                        client = Client.from_dict(record["client"], validate=False)
+                        clients[i] = client
+                        if client.get_client_id() is not None:
+                            index[client.get_client_id()] = i
+                elif record["op"] == "delete":
+                    i = index.pop(record["client_id"], None)
+                    if i is not None:
+                        clients[i] = None
+            if end < offset:
+                file.truncate(end)
+            elif end and not line.endswith(b"\n"):
+                file.seek(end)
+                file.write(b"\n")
+        return [client for client in clients if client is not None]
+
+    def persist(self, records):
+        if not self.journal:
+            self.save_all()
+            return
+        with open(self.journal_name, 'ab+') as file:
+            if file.seek(0, os.SEEK_END):
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    file.write(b"\n")
+            file.writelines((json.dumps(record) + "\n").encode() for record in records)
+        self.journal_size += len(records)
+        if self.journal_size >= self.compact_threshold:
+            self.save_all()
+
+    def save_all(self):
+        self.assign_missing_ids()
+        data = [client.to_dict() for client in self.clients]
+        tmp_name = self.file_name + ".tmp"
+        with open(tmp_name, 'w') as file:
+            json.dump(data, file, indent=4)
+        os.replace(tmp_name, self.file_name)
+        if self.journal:
+            open(self.journal_name, 'w').close()
+            self.journal_size = 0
+
+class ClientRepJsonl(ClientRepAppendFile):
+    def __init__(self, file_name, lazy=True):
+        self.index_name = file_name + ".idx"
+        super().__init__(file_name, lazy=lazy)
+        self.build_offsets()
+        self.last_id = max([self.last_id] + list(self.offsets))
+
+    def build_offsets(self):
+        self.lines = []
+        self.offsets = {}
+        try:
+            size = os.path.getsize(self.file_name)
+        except FileNotFoundError:
+            return
+        indexed_size = self.read_index()
+        if indexed_size is None or indexed_size > size:
+            self.lines = []
+            self.offsets = {}
+            indexed_size = 0
+        if indexed_size < size:
+            self.scan_lines(indexed_size)
+            self.write_index(size)
+
+    def add_line(self, offset, length, client_id):
+        self.lines.append((offset, length, client_id))
+        if client_id is not None:
+            self.offsets[client_id] = (offset, length)
+
+    def scan_lines(self, offset):
+        with open(self.file_name, 'rb') as file:
+            file.seek(offset)
+            for line in file:
+                if line.strip():
+                    self.add_line(offset, len(line), json.loads(line).get("client_id", None))
+                offset += len(line)
+
+    def read_index(self):
+        try:
+            with open(self.index_name, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            if os.path.getsize(self.file_name):
+                print(f"Warning: The index of '{self.file_name}' is missing. Rebuilding it from the data file.")
+            return None
+        if len(data) < JSONL_INDEX_HEADER.size or (len(data) - JSONL_INDEX_HEADER.size) % JSONL_INDEX_ENTRY.size:
+            print(f"Warning: The index of '{self.file_name}' is corrupted. Rebuilding it from the data file.")
+            return None
+        indexed_size, = JSONL_INDEX_HEADER.unpack_from(data)
+        for client_id, offset, length in JSONL_INDEX_ENTRY.iter_unpack(memoryview(data)[JSONL_INDEX_HEADER.size:]):
+            self.add_line(offset, length, client_id or None)
+        return indexed_size
+
+    def write_index(self, indexed_size):
+        with open(self.index_name + ".tmp", 'wb') as file:
+            file.write(JSONL_INDEX_HEADER.pack(indexed_size))
+            file.writelines(JSONL_INDEX_ENTRY.pack(client_id or 0, offset, length) for offset, length, client_id in self.lines)
+        os.replace(self.index_name + ".tmp", self.index_name)
+
+    def read_all(self):
+        try:
+            return super().read_all()
+        except json.JSONDecodeError:
+            print(f"Error: The file '{self.file_name}' is not a valid JSON lines file.")
             return []
-        except yaml.YAMLError as e:
-            print(f"Error reading YAML file: {e}")
+
+    def stream_records(self, chunk_size=None):
+        try:
+            file = open(self.file_name, 'r', buffering=chunk_size or 65536)
+        except FileNotFoundError:
+            return
+        with file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def read_lines(self, offset, length):
+        with open(self.file_name, 'rb') as file:
+            file.seek(offset)
+            return file.read(length).splitlines()
+
+    def save_all(self):
+        self.assign_missing_ids()
+        lines = [(json.dumps(client.to_dict()) + "\n").encode() for client in self.clients]
+        tmp_name = self.file_name + ".tmp"
+        with open(tmp_name, 'wb') as file:
+            file.writelines(lines)
+        os.replace(tmp_name, self.file_name)
+        self.lines = []
+        self.offsets = {}
+        offset = 0
+        for client, line in zip(self.clients, lines):
+            self.add_line(offset, len(line), client.get_client_id())
+            offset += len(line)
+        self.write_index(offset)
+
+    def get_by_id(self, client_id):
+        if not self.can_stream():
+            return super().get_by_id(client_id)
+        if client_id not in self.offsets:
+            raise ValueError(f"Client with ID {client_id} not found")
+        line, = self.read_lines(*self.offsets[client_id])
+        return Client.from_dict(json.loads(line), validate=False)
+
+    def get_k_n_short_list(self, k, n):
+        if not self.can_stream():
+            return super().get_k_n_short_list(k, n)
+        lines = self.lines[(k - 1) * n:(k - 1) * n + n]
+        if not lines:
             return []
+        start = lines[0][0]
+        end = lines[-1][0] + lines[-1][1]
+        return [Client.from_dict(json.loads(line), validate=False) for line in self.read_lines(start, end - start) if line.strip()]
+
+    def get_count(self):
+        if not self.can_stream():
+            return super().get_count()
+        return len(self.lines)
+
+    def append_rows(self, rows):
+        first = len(self.lines)
+        with open(self.file_name, 'ab') as file:
+            offset = file.tell()
+            for row in rows:
+                line = (json.dumps(dict(zip(ClientBatch.COLUMNS, row))) + "\n").encode()
+                file.write(line)
+                self.add_line(offset, len(line), row[5])
+                offset += len(line)
+        if not os.path.exists(self.index_name):
+            self.write_index(offset)
+            return
+        with open(self.index_name, 'r+b') as file:
+            file.seek(0, os.SEEK_END)
+            file.writelines(
+                JSONL_INDEX_ENTRY.pack(client_id or 0, line_offset, length) for line_offset, length, client_id in self.lines[first:]
+            )
+            file.seek(0)
+            file.write(JSONL_INDEX_HEADER.pack(offset))
+
+    def export_json(self, json_file_name):
+        tmp_name = json_file_name + ".tmp"
+        with open(tmp_name, 'w') as file:
+            file.write("[")
+            separator = "\n"
+            for client in self.iter_clients():
+                file.write(separator + textwrap.indent(json.dumps(client.to_dict(), indent=4), "    "))
+                separator = ",\n"
+            file.write("]" if separator == "\n" else "\n]")
+        os.replace(tmp_name, json_file_name)
+
+    @classmethod
+    def import_json(cls, json_file_name, file_name):
+        tmp_name = file_name + ".tmp"
+        with open(tmp_name, 'w') as file:
+            for client in ClientRepJson(json_file_name, lazy=True).iter_clients():
+                file.write(json.dumps(client.to_dict()) + "\n")
+        os.replace(tmp_name, file_name)
+        if os.path.exists(file_name + ".idx"):
+            os.remove(file_name + ".idx")
+        return cls(file_name)
+
+class ClientRepBinary(ClientRepAppendFile):
+    def __init__(self, file_name, lazy=True):
+        self.index_name = file_name + ".idx"
+        self.ids_name = file_name + ".ids"
+        self.data_map = None
+        self.index_map = None
+        self.ids_map = None
+        super().__init__(file_name, lazy=lazy)
+        if self.open_maps() and self.ids_map:
+            client_id, _ = BINARY_INDEX_ENTRY.unpack_from(self.ids_map, len(self.ids_map) - BINARY_INDEX_ENTRY.size)
+            self.last_id = max(self.last_id, client_id)
+
+    def open_maps(self):
+        if self.data_map is not None:
+            return True
+        try:
+            with open(self.file_name, 'rb') as file:
+                self.data_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return False
+        magic, version = BINARY_HEADER.unpack_from(self.data_map, 0)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            self.close_maps()
+            raise ValueError(f"The file '{self.file_name}' is not a client binary store.")
+        if not (os.path.exists(self.index_name) and os.path.exists(self.ids_name)):
+            print(f"Warning: The index of '{self.file_name}' is missing. Rebuilding it from the data file.")
+            self.write_index(self.scan_entries())
+        self.index_map = self.map_file(self.index_name)
+        self.ids_map = self.map_file(self.ids_name)
+        return True
+
+    @staticmethod
+    def map_file(name):
+        with open(name, 'rb') as file:
+            if os.fstat(file.fileno()).st_size:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return b''
+
+    def close_maps(self):
+        for file_map in (self.data_map, self.index_map, self.ids_map):
+            if isinstance(file_map, mmap.mmap):
+                file_map.close()
+        self.data_map = None
+        self.index_map = None
+        self.ids_map = None
+
+    def scan_entries(self):
+        entries = []
+        offset = BINARY_HEADER.size
+        while offset + BINARY_RECORD.size <= len(self.data_map):
+            length, client_id = BINARY_RECORD.unpack_from(self.data_map, offset)
+            if offset + 4 + length > len(self.data_map):
+                break
+            entries.append((client_id, offset))
+            offset += 4 + length
+        return entries
+
+    def write_index(self, entries):
+        for name, ordered in ((self.index_name, entries), (self.ids_name, sorted(entries))):
+            with open(name + ".tmp", 'wb') as file:
+                file.writelines(BINARY_INDEX_ENTRY.pack(*entry) for entry in ordered)
+            os.replace(name + ".tmp", name)
+
+    def find_offset(self, client_id):
+        low, high = 0, len(self.ids_map) // BINARY_INDEX_ENTRY.size
+        while low < high:
+            middle = (low + high) // 2
+            middle_id, offset = BINARY_INDEX_ENTRY.unpack_from(self.ids_map, middle * BINARY_INDEX_ENTRY.size)
+            if middle_id < client_id:
+                low = middle + 1
+            elif middle_id > client_id:
+                high = middle
+            else:
+                return offset
+        return None
+
+    @staticmethod
+    def encode_row(fields, client_id):
+        data = b''
+        for field in fields:
+            value = field.encode()
+            data += BINARY_FIELD.pack(len(value)) + value
+        return BINARY_RECORD.pack(BINARY_RECORD.size - 4 + len(data), client_id) + data
+
+    def encode_record(self, client):
+        fields = (client.surname, client.name, client.patronymic, client.address, client.phone)
+        return self.encode_row(fields, client.get_client_id())
+
+    def decode_fields(self, offset):
+        _, client_id = BINARY_RECORD.unpack_from(self.data_map, offset)
+        pos = offset + BINARY_RECORD.size
+        fields = []
+        for _ in range(5):
+            length, = BINARY_FIELD.unpack_from(self.data_map, pos)
+            pos += BINARY_FIELD.size
+            fields.append(self.data_map[pos:pos + length].decode())
+            pos += length
+        return fields, client_id
+
+    def decode_record(self, offset):
+        fields, client_id = self.decode_fields(offset)
+        return Client._from_validated(*fields, client_id=client_id)
+
+    def stream_clients(self, chunk_size=None):
+        if not self.open_maps():
+            return
+        for i in range(len(self.index_map) // BINARY_INDEX_ENTRY.size):
+            _, offset = BINARY_INDEX_ENTRY.unpack_from(self.index_map, i * BINARY_INDEX_ENTRY.size)
+            yield self.decode_record(offset)
+
+    def stream_records(self, chunk_size=None):
+        if not self.open_maps():
+            return
+        for i in range(len(self.index_map) // BINARY_INDEX_ENTRY.size):
+            _, offset = BINARY_INDEX_ENTRY.unpack_from(self.index_map, i * BINARY_INDEX_ENTRY.size)
+            fields, client_id = self.decode_fields(offset)
+            yield dict(zip(ClientBatch.COLUMNS, fields + [client_id]))
 
     def save_all(self):
-        data = []
+        data = [BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION)]
+        entries = []
+        offset = BINARY_HEADER.size
+        self.assign_missing_ids()
         for client in self.clients:
-            client_data = client.to_dict()
-            if client_data["client_id"] is None:
-                client_data["client_id"] = self.get_new_client_id()
-            data.append(client_data)
-        with open(self.file_name, 'w') as file:
-            yaml.safe_dump(data, file, default_flow_style=False)
+            record = self.encode_record(client)
+            data.append(record)
+            entries.append((client.get_client_id(), offset))
+            offset += len(record)
+        self.close_maps()
+        with open(self.file_name + ".tmp", 'wb') as file:
+            file.writelines(data)
+        os.replace(self.file_name + ".tmp", self.file_name)
+        self.write_index(entries)
 
     def get_by_id(self, client_id):
-        for client in self.clients:
-            if client.get_client_id() == client_id:
-                return client
-        raise ValueError(f"Client with ID {client_id} not found")
+        if not self.can_stream():
+            return super().get_by_id(client_id)
+        offset = self.find_offset(client_id) if self.open_maps() else None
+        if offset is None:
+            raise ValueError(f"Client with ID {client_id} not found")
+        return self.decode_record(offset)
 
     def get_k_n_short_list(self, k, n):
+        if not self.can_stream():
+            return super().get_k_n_short_list(k, n)
+        if not self.open_maps():
+            return []
         start = (k - 1) * n
-        end = start + n
-        return self.clients[start:end]
+        end = min(start + n, len(self.index_map) // BINARY_INDEX_ENTRY.size)
+        clients = []
+        for i in range(start, end):
+            _, offset = BINARY_INDEX_ENTRY.unpack_from(self.index_map, i * BINARY_INDEX_ENTRY.size)
+            clients.append(self.decode_record(offset))
+        return clients
 
-    def sort_by_field(self, field="client_id"):
-        self.clients.sort(key=lambda client: getattr(client, field))
+    def get_count(self):
+        if not self.can_stream():
+            return super().get_count()
+        if not self.open_maps():
+            return 0
+        return len(self.index_map) // BINARY_INDEX_ENTRY.size
+
+    def append_rows(self, rows):
+        self.open_maps()
+        self.close_maps()
+        entries = []
+        with open(self.file_name, 'ab') as file:
+            new_store = file.tell() == 0
+            if new_store:
+                file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION))
+            offset = file.tell()
+            for row in rows:
+                record = self.encode_row(row[:5], row[5])
+                file.write(record)
+                entries.append((row[5], offset))
+                offset += len(record)
+        for name, ordered in ((self.index_name, entries), (self.ids_name, sorted(entries))):
+            with open(name, 'wb' if new_store else 'ab') as file:
+                file.writelines(BINARY_INDEX_ENTRY.pack(*entry) for entry in ordered)
+
+class ClientRepYaml(ClientRepFile):
+    def __init__(self, file_name, lazy=False, snapshot=False):
+        self.snapshot = snapshot
+        self.snapshot_name = file_name + ".cache"
+        super().__init__(file_name, lazy)
 
-    def add_client(self, surname, name, patronymic, address, phone):
-        new_id = self.get_new_client_id()
-        new_client = Client(surname, name, patronymic, address, phone, new_id)
-        self.clients.append(new_client)
-        self.save_all()
+    def read_all(self):
+        try:
+            with open(self.file_name, 'rb') as file:
+                content = file.read()
+                signature = self.file_signature(file, content) if self.snapshot else None
+        except FileNotFoundError:
+            print(f"Error: The file '{self.file_name}' was not found. Returning empty client list.")
+            return []
+        if self.snapshot:
+            clients = self.read_snapshot(signature)
+            if clients is not None:
+                return clients
+        try:
+            data = yaml.load(content, Loader=YamlLoader)
+        except yaml.YAMLError as e:
+            print(f"Error reading YAML file: {e}")
+            return []
+        if data is None:
+            print(f"Warning: The YAML file is empty or invalid. Returning empty client list.")
+            return []
+        clients = []
+        for client_data in data:
+            clients.append(Client.from_dict(client_data, validate=False))
+        if self.snapshot:
+            self.save_snapshot(signature, clients)
+        return clients
 
-    def replace_by_id(self, client_id, new_client):
-        for i, client in enumerate(self.clients):
-            if client.get_client_id() == client_id:
-                self.clients[i] = new_client
-                self.save_all()
-                return True
-        return False
+    def save_all(self):
+        self.assign_missing_ids()
+        data = [client.to_dict() for client in self.clients]
+        content = yaml.dump(data, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8')
+        with open(self.file_name, 'wb') as file:
+            file.write(content)
+            file.flush()
+            signature = self.file_signature(file, content) if self.snapshot else None
+        if self.snapshot:
+            self.save_snapshot(signature, self.clients)
 
-    def delete_by_id(self, client_id):
-        self.clients = [client for client in self.clients if client.get_client_id() != client_id]
-        self.save_all()
+    @staticmethod
+    def file_signature(file, content):
+        stat = os.fstat(file.fileno())
+        return stat.st_size, stat.st_mtime_ns, hashlib.blake2b(content, digest_size=16).hexdigest()
 
-    def get_count(self):
-        return len(self.clients)
+    def read_snapshot(self, signature):
+        try:
+            with open(self.snapshot_name, 'rb') as file:
+                snapshot_signature, rows = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            print(f"Warning: The snapshot '{self.snapshot_name}' is corrupted. Parsing the YAML file instead.")
+            return None
+        if snapshot_signature != signature:
+            return None
+        return [Client._from_validated(*row) for row in rows]
+
+    def save_snapshot(self, signature, clients):
+        rows = [
+            (client.surname, client.name, client.patronymic, client.address, client.phone, client.client_id)
+            for client in clients
+        ]
+        tmp_name = self.snapshot_name + ".tmp"
+        with open(tmp_name, 'wb') as file:
+            pickle.dump((signature, rows), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, self.snapshot_name)
 
-    def get_new_client_id(self):
-        max_id = max([client.get_client_id() for client in self.clients if client.get_client_id() is not None],
-                     default=0)
-        return max_id + 1
+class ClientRepYamlMulti(ClientRepAppendFile):
+    def __init__(self, file_name, lazy=True):
+        self.ids_synced = False
+        super().__init__(file_name, lazy)
+
+    def stream_records(self, chunk_size=None):
+        try:
+            file = open(self.file_name, 'r')
+        except FileNotFoundError:
+            return
+        with file:
+            for client_data in yaml.load_all(file, Loader=YamlLoader):
+                if client_data is not None:
+                    yield client_data
+
+    def read_all(self):
+        try:
+            return super().read_all()
+        except yaml.YAMLError as e:
+            print(f"Error reading YAML file: {e}")
+            return []
+
+    def save_all(self):
+        self.assign_missing_ids()
+        data = [client.to_dict() for client in self.clients]
+        with open(self.file_name, 'w') as file:
+            yaml.dump_all(data, file, Dumper=YamlDumper, default_flow_style=False, explicit_start=True)
+
+    def sync_last_id(self):
+        if self.ids_synced:
+            return
+        if self._clients is None:
+            ids = [client_data.get("client_id") for client_data in self.iter_records()]
+        else:
+            ids = list(self._index)
+        self.last_id = max([self.last_id] + [client_id for client_id in ids if client_id is not None])
+        self.ids_synced = True
+
+    def append_rows(self, rows):
+        records = [dict(zip(ClientBatch.COLUMNS, row)) for row in rows]
+        with open(self.file_name, 'a') as file:
+            yaml.dump_all(records, file, Dumper=YamlDumper, default_flow_style=False, explicit_start=True)
 
 class ClientRepDB:
-    _instance = None 
-
-    def __new__(cls, db_name, user, password, host="localhost", port="5432"):
-        if cls._instance is None: 
-            cls._instance = super(ClientRepDB, cls).__new__(cls)
-            cls._instance.db_name = db_name
-            cls._instance.user = user
-            cls._instance.password = password
-            cls._instance.host = host
-            cls._instance.port = port
-            cls._instance.conn = cls._instance.connect_to_db()
-            cls._instance.create_table()
-        return cls._instance 
-
-    def connect_to_db(self):
+    _instances = {}
+    _instances_lock = threading.Lock()
+    _cursor_ids = count(1)
+    SORTABLE_FIELDS = ("client_id", "surname", "name", "patronymic", "address", "phone")
+    INDEXED_FIELDS = ("surname", "name", "phone")
+    NULLABLE_FIELDS = ("patronymic",)
+    SEARCH_FIELDS = ("surname", "name", "patronymic")
+    PREPARED_STATEMENTS = {
+        "clients_get_by_id": "SELECT * FROM clients WHERE client_id = $1",
+        "clients_add": "INSERT INTO clients (surname, name, patronymic, address, phone) VALUES ($1, $2, $3, $4, $5) RETURNING client_id",
+        "clients_delete_by_id": "DELETE FROM clients WHERE client_id = $1",
+    }
+
+    def __new__(cls, db_name, user, password, host="localhost", port="5432", minconn=1, maxconn=10,
+                health_check=False, composite_index=False, prepared=False, pool_timeout=30):
+        key = (db_name, user, password, host, port, minconn, maxconn, health_check, composite_index, prepared,
+               pool_timeout)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                instance = super(ClientRepDB, cls).__new__(cls)
+                instance.db_name = db_name
+                instance.user = user
+                instance.password = password
+                instance.host = host
+                instance.port = port
+                instance.health_check = health_check
+                instance.prepared = prepared
+                instance.pool_timeout = pool_timeout
+                instance.prepared_connections = weakref.WeakSet()
+                instance.local = threading.local()
+                instance.slots = threading.BoundedSemaphore(maxconn)
+                instance.pool = instance.connect_to_db(minconn, maxconn)
+                instance.create_table(composite_index)
+                cls._instances[key] = instance
+            return cls._instances[key]
+
+    def connect_to_db(self, minconn=1, maxconn=10):
         try:
-            return psycopg2.connect(
+            return psycopg2.pool.ThreadedConnectionPool(
+                minconn, maxconn,
                 dbname=self.db_name, user=self.user, password=self.password, host=self.host, port=self.port
             )
         except Exception as e:
             print(f"Error connecting to database: {e}")
             raise
 
-    def create_table(self):
-        query = """
+    def is_healthy(self, conn):
+        if conn.closed:
+            return False
+        if not self.health_check:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    @contextmanager
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        if getattr(self.local, "users", 0) == 0:
+            self.local.held = self.checkout()
+        self.local.users = getattr(self.local, "users", 0) + 1
+        conn = self.local.held
+        try:
+            yield conn
+        finally:
+            self.local.users -= 1
+            if self.local.users == 0:
+                self.local.held = None
+                self.pool.putconn(conn, close=bool(conn.closed))
+                self.slots.release()
+
+    def checkout(self):
+        if not self.slots.acquire(timeout=self.pool_timeout):
+            raise psycopg2.pool.PoolError(
+                f"No database connection was released within {self.pool_timeout} seconds: the pool is exhausted"
+            )
+        try:
+            conn = self.pool.getconn()
+            if not self.is_healthy(conn):
+                self.pool.putconn(conn, close=True)
+                conn = self.pool.getconn()
+            return conn
+        except BaseException:
+            self.slots.release()
+            raise
+
+    @contextmanager
+    def transaction(self):
+        if getattr(self.local, "conn", None) is not None:
+            yield
+            return
+        with self.connection() as conn:
+            self.local.conn = conn
+            try:
+                yield
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self.local.conn = None
+
+    def in_transaction(self, conn):
+        return getattr(self.local, "conn", None) is conn
+
+    def commit(self, conn):
+        if not self.in_transaction(conn):
+            conn.commit()
+
+    @classmethod
+    def schema_statements(cls, composite_index=False):
+        statements = ["""
         CREATE TABLE IF NOT EXISTS clients (
             client_id SERIAL PRIMARY KEY,
             surname TEXT NOT NULL,
@@ -276,81 +1425,552 @@ class ClientRepDB:
             address TEXT NOT NULL,
             phone TEXT NOT NULL
         );
-        """
-        with self.conn.cursor() as cursor:
-            cursor.execute(query)
-            self.conn.commit()
+        """]
+        for field in cls.INDEXED_FIELDS:
+            statements.append(f'CREATE INDEX IF NOT EXISTS "clients_{field}_idx" ON clients ("{field}", client_id)')
+        statements.append("CREATE INDEX IF NOT EXISTS clients_surname_pattern_idx ON clients (surname text_pattern_ops)")
+        for field in cls.SEARCH_FIELDS:
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS "clients_{field}_search_idx" ON clients (lower("{field}") text_pattern_ops)'
+            )
+        if composite_index:
+            statements.append("CREATE INDEX IF NOT EXISTS clients_full_name_idx ON clients (surname, name, client_id)")
+        return statements
+
+    def create_table(self, composite_index=False):
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                for statement in self.schema_statements(composite_index):
+                    cursor.execute(statement)
+                conn.commit()
+
+    def prepare(self, conn):
+        if conn in self.prepared_connections:
+            return
+        with conn.cursor() as cursor:
+            for name, query in self.PREPARED_STATEMENTS.items():
+                cursor.execute(f"PREPARE {name} AS {query}")
+        self.prepared_connections.add(conn)
+
+    def order_field(self, field):
+        if field not in self.SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort by field '{field}'. Allowed fields: {', '.join(self.SORTABLE_FIELDS)}")
+        return sql.Identifier(field)
+
+    def sort_key(self, field):
+        identifier = self.order_field(field)
+        if field in self.NULLABLE_FIELDS:
+            return sql.SQL("COALESCE({}, '')").format(identifier)
+        return identifier
 
     def read_all(self):
         query = "SELECT * FROM clients"
-        with self.conn.cursor() as cursor:
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            clients = [
-                Client(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
-                for row in rows
-            ]
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                rows = cursor.fetchall()
+        clients = [
+            Client._from_validated(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
+            for row in rows
+        ]
         return clients
 
+    def iter_all(self, order_by=None, batch_size=2000):
+        query = sql.SQL("SELECT * FROM clients")
+        if order_by is not None:
+            query += sql.SQL(" ORDER BY {}, client_id").format(self.sort_key(order_by))
+        with self.connection() as conn:
+            with conn.cursor(name=f"clients_iter_{next(self._cursor_ids)}", withhold=not self.in_transaction(conn)) as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(query)
+                for row in cursor:
+                    yield Client._from_validated(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
+
+    def get_k_n_short_list(self, k, n, sort_field="client_id", after=None):
+        field = self.sort_key(sort_field)
+        if after is None:
+            query = sql.SQL(
+                "SELECT client_id, surname, name, {field} FROM clients ORDER BY {field}, client_id LIMIT %s OFFSET %s"
+            ).format(field=field)
+            params = (n, (k - 1) * n)
+        else:
+            query = sql.SQL(
+                "SELECT client_id, surname, name, {field} FROM clients "
+                "WHERE ({field}, client_id) > (%s, %s) ORDER BY {field}, client_id LIMIT %s"
+            ).format(field=field)
+            params = (after[0], after[1], n)
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+        return [ShortClient(surname=row[1], name=row[2], client_id=row[0], sort_key=(row[3], row[0])) for row in rows]
+
+    def get_many(self, client_ids):
+        query = "SELECT * FROM clients WHERE client_id = ANY(%s)"
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, (list(client_ids),))
+                rows = cursor.fetchall()
+        return {
+            row[0]: Client._from_validated(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
+            for row in rows
+        }
+
     def get_by_id(self, client_id):
         query = "SELECT * FROM clients WHERE client_id = %s"
-        with self.conn.cursor() as cursor:
-            cursor.execute(query, (client_id,))
-            row = cursor.fetchone()
-            if row:
-                return Client(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
-            else:
-                raise ValueError(f"Client with ID {client_id} not found")
+        with self.connection() as conn:
+            if self.prepared:
+                self.prepare(conn)
+                query = "EXECUTE clients_get_by_id (%s)"
+            with conn.cursor() as cursor:
+                cursor.execute(query, (client_id,))
+                row = cursor.fetchone()
+        if row:
+            return Client._from_validated(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
+        else:
+            raise ValueError(f"Client with ID {client_id} not found")
 
     def add_client(self, surname, name, patronymic, address, phone):
         query = "INSERT INTO clients (surname, name, patronymic, address, phone) VALUES (%s, %s, %s, %s, %s) RETURNING client_id"
-        with self.conn.cursor() as cursor:
-            cursor.execute(query, (surname, name, patronymic, address, phone))
-            client_id = cursor.fetchone()[0]
-            self.conn.commit()
+        with self.connection() as conn:
+            if self.prepared:
+                self.prepare(conn)
+                query = "EXECUTE clients_add (%s, %s, %s, %s, %s)"
+            with conn.cursor() as cursor:
+                cursor.execute(query, (surname, name, patronymic, address, phone))
+                client_id = cursor.fetchone()[0]
+                self.commit(conn)
         return client_id
 
+    def add_clients(self, clients, chunk_size=10000, use_copy=True):
+        rows = ((client.surname, client.name, client.patronymic, client.address, client.phone) for client in clients)
+        return self.add_rows(rows, chunk_size, use_copy)
+
+    def add_rows(self, rows, chunk_size=10000, use_copy=True):
+        client_ids = []
+        chunk = []
+        with self.connection() as conn:
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    client_ids.extend(self.insert_chunk(conn, chunk, use_copy))
+                    chunk = []
+            if chunk:
+                client_ids.extend(self.insert_chunk(conn, chunk, use_copy))
+        return client_ids
+
+    def insert_chunk(self, conn, chunk, use_copy):
+        with conn.cursor() as cursor:
+            if use_copy:
+                savepoint = self.in_transaction(conn)
+                try:
+                    if savepoint:
+                        cursor.execute("SAVEPOINT clients_copy")
+                    client_ids = self.next_ids(cursor, len(chunk))
+                    cursor.copy_expert(
+                        "COPY clients (client_id, surname, name, patronymic, address, phone) FROM STDIN",
+                        self.copy_buffer(chunk, client_ids)
+                    )
+                    self.commit(conn)
+                    return client_ids
+                except psycopg2.Error as e:
+                    print(f"Warning: COPY failed, falling back to INSERT: {e}")
+                    if savepoint:
+                        cursor.execute("ROLLBACK TO SAVEPOINT clients_copy")
+                    else:
+                        conn.rollback()
+            query = "INSERT INTO clients (surname, name, patronymic, address, phone) VALUES %s RETURNING client_id"
+            rows = psycopg2.extras.execute_values(cursor, query, chunk, page_size=len(chunk), fetch=True)
+            self.commit(conn)
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def next_ids(cursor, n):
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence('clients', 'client_id')) FROM generate_series(1, %s)", (n,)
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def reserve_ids(self, n):
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                client_ids = self.next_ids(cursor, n)
+            self.commit(conn)
+        return client_ids
+
+    @staticmethod
+    def copy_buffer(rows, client_ids):
+        buffer = io.StringIO()
+        for row, client_id in zip(rows, client_ids):
+            fields = ["\\N" if field is None else field.translate(COPY_ESCAPES) for field in row]
+            buffer.write(f"{client_id}\t" + "\t".join(fields) + "\n")
+        buffer.seek(0)
+        return buffer
+
     def sort_by_field(self, field="surname"):
-        query = f"SELECT * FROM clients ORDER BY {field}"
-        with self.conn.cursor() as cursor:
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            clients = [
-                Client(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
-                for row in rows
-            ]
+        query = sql.SQL("SELECT * FROM clients ORDER BY {}, client_id").format(self.sort_key(field))
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                rows = cursor.fetchall()
+        clients = [
+            Client._from_validated(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
+            for row in rows
+        ]
         return clients
 
+    def find_by_phone(self, phone):
+        return self.select_clients("SELECT * FROM clients WHERE phone = %s ORDER BY client_id", (phone,))
+
+    def find_by_surname(self, prefix, limit=None):
+        pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self.select_clients(
+            "SELECT * FROM clients WHERE surname LIKE %s ORDER BY surname, name, client_id LIMIT %s", (pattern, limit)
+        )
+
+    def search_prefix(self, prefix, limit=10):
+        pattern = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        query = sql.SQL("SELECT * FROM clients WHERE {} ORDER BY surname, name, client_id LIMIT %s").format(
+            sql.SQL(" OR ").join(sql.SQL("lower({}) LIKE %s").format(sql.Identifier(field)) for field in self.SEARCH_FIELDS)
+        )
+        return self.select_clients(query, (pattern,) * len(self.SEARCH_FIELDS) + (limit,))
+
+    def find_by_surname_range(self, start, end):
+        return self.select_clients(
+            "SELECT * FROM clients WHERE surname >= %s AND surname < %s ORDER BY surname, name, client_id", (start, end)
+        )
+
+    def select_clients(self, query, params):
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+        return [
+            Client._from_validated(surname=row[1], name=row[2], patronymic=row[3], address=row[4], phone=row[5], client_id=row[0])
+            for row in rows
+        ]
+
+    def get_count(self, estimate=False):
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                if estimate:
+                    cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = 'clients'::regclass")
+                    count = cursor.fetchone()[0]
+                    if count >= 0:
+                        return count
+                cursor.execute("SELECT count(*) FROM clients")
+                return cursor.fetchone()[0]
+
+    def replace_by_id(self, client_id, new_client):
+        query = (
+            "UPDATE clients SET surname = %s, name = %s, patronymic = %s, address = %s, phone = %s, "
+            "client_id = COALESCE(%s, client_id) WHERE client_id = %s RETURNING client_id"
+        )
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, (new_client.surname, new_client.name, new_client.patronymic, new_client.address,
+                                       new_client.phone, new_client.get_client_id(), client_id))
+                row = cursor.fetchone()
+                self.commit(conn)
+        return row[0] if row else None
+
+    def apply_changes(self, records):
+        with self.connection() as conn:
+            with conn.cursor() as cursor:
+                for record in records:
+                    if record["op"] in ("add", "replace"):
+                        data = record["client"]
+                        values = (data["surname"], data["name"], data["patronymic"], data["address"], data["phone"])
+                    if record["op"] == "add" and record["client"]["client_id"] is None:
+                        cursor.execute(
+                            "INSERT INTO clients (surname, name, patronymic, address, phone) VALUES (%s, %s, %s, %s, %s)",
+                            values
+                        )
+                    elif record["op"] == "add":
+                        cursor.execute(
+                            "INSERT INTO clients (client_id, surname, name, patronymic, address, phone) "
+                            "VALUES (%s, %s, %s, %s, %s, %s) ON CONFLICT (client_id) DO UPDATE SET "
+                            "surname = EXCLUDED.surname, name = EXCLUDED.name, patronymic = EXCLUDED.patronymic, "
+                            "address = EXCLUDED.address, phone = EXCLUDED.phone",
+                            (data["client_id"],) + values
+                        )
+                    elif record["op"] == "replace":
+                        cursor.execute(
+                            "UPDATE clients SET surname = %s, name = %s, patronymic = %s, address = %s, phone = %s, "
+                            "client_id = COALESCE(%s, client_id) WHERE client_id = %s",
+                            values + (data["client_id"], record["client_id"])
+                        )
+                    elif record["op"] == "delete":
+                        cursor.execute("DELETE FROM clients WHERE client_id = %s", (record["client_id"],))
+            self.commit(conn)
+
+    def delete_by_id(self, client_id):
+        query = "DELETE FROM clients WHERE client_id = %s"
+        with self.connection() as conn:
+            if self.prepared:
+                self.prepare(conn)
+                query = "EXECUTE clients_delete_by_id (%s)"
+            with conn.cursor() as cursor:
+                cursor.execute(query, (client_id,))
+                self.commit(conn)
+
     def close(self):
-        if self.conn:
-            self.conn.close()
+        with self._instances_lock:
+            for key, instance in list(self._instances.items()):
+                if instance is self:
+                    del self._instances[key]
+        self.pool.closeall()
+
+class ClientCache:
+    def __init__(self, max_size=1000, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, client_id):
+        with self.lock:
+            entry = self.entries.get(client_id)
+            if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+                self.entries.move_to_end(client_id)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self.entries[client_id]
+            self.misses += 1
+            return None
+
+    def put(self, client):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self.lock:
+            self.entries[client.get_client_id()] = (client, expires_at)
+            self.entries.move_to_end(client.get_client_id())
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, client_id):
+        with self.lock:
+            self.entries.pop(client_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class ClientRepDBAdapter(ClientRepository):
+    def __init__(self, db_name, user, password, host="localhost", port="5432", minconn=1, maxconn=10,
+                 health_check=False, composite_index=False, cache_size=0, cache_ttl=None, prepared=False,
+                 pool_timeout=30):
+        self.client_rep_db = ClientRepDB(db_name, user, password, host, port, minconn, maxconn, health_check,
+                                         composite_index, prepared, pool_timeout)
+        self.cache = ClientCache(cache_size, cache_ttl) if cache_size else None
+        super().__init__(lazy=True)
+
+    def can_stream(self):
+        return True
+
+    def iter_clients(self, chunk_size=None):
+        return self.client_rep_db.iter_all(batch_size=chunk_size or 2000)
 
-class ClientRepDBAdapter:
-    def __init__(self, db_name, user, password, host="localhost", port="5432"):
-        self.client_rep_db = ClientRepDB(db_name, user, password, host, port)
+    def save_all(self):
+        self.persist([{"op": "add", "client": client.to_dict()} for client in self.clients])
+
+    def persist(self, records):
+        self.client_rep_db.apply_changes(records)
+        self._clients = None
+        if self.cache is not None:
+            for record in records:
+                if "client_id" in record:
+                    self.cache.invalidate(record["client_id"])
+                if "client" in record:
+                    self.cache.invalidate(record["client"]["client_id"])
 
     def read_all(self):
         return self.client_rep_db.read_all()
 
+    @contextmanager
+    def batch(self):
+        try:
+            with self.client_rep_db.transaction():
+                yield self
+        except BaseException:
+            if self.cache is not None:
+                self.cache.clear()
+            raise
+
+    def get_new_client_id(self):
+        return self.client_rep_db.reserve_ids(1)[0]
+
+    def reserve_ids(self, n):
+        return self.client_rep_db.reserve_ids(n)
+
+    def iter_all(self, order_by=None, batch_size=2000):
+        return self.client_rep_db.iter_all(order_by, batch_size)
+
     def get_by_id(self, client_id):
-        return self.client_rep_db.get_by_id(client_id)
+        if self.cache is None:
+            return self.client_rep_db.get_by_id(client_id)
+        client = self.cache.get(client_id)
+        if client is None:
+            client = self.client_rep_db.get_by_id(client_id)
+            self.cache.put(client)
+        return client
+
+    def get_many(self, client_ids):
+        found = {}
+        missing = []
+        for client_id in client_ids:
+            client = self.cache.get(client_id) if self.cache is not None else None
+            if client is None:
+                missing.append(client_id)
+            else:
+                found[client_id] = client
+        if missing:
+            fetched = self.client_rep_db.get_many(missing)
+            if self.cache is not None:
+                for client in fetched.values():
+                    self.cache.put(client)
+            found.update(fetched)
+        return [found[client_id] for client_id in client_ids if client_id in found]
+
+    def get_k_n_short_list(self, k, n, sort_field="client_id", after=None):
+        return self.client_rep_db.get_k_n_short_list(k, n, sort_field, after)
+
+    def get_count(self, estimate=False):
+        return self.client_rep_db.get_count(estimate)
+
+    def find_by_phone(self, phone):
+        return self.client_rep_db.find_by_phone(phone)
+
+    def find_by_surname(self, prefix, limit=None):
+        return self.client_rep_db.find_by_surname(prefix, limit)
+
+    def search_prefix(self, prefix, limit=10):
+        return self.client_rep_db.search_prefix(prefix, limit)
+
+    def find_by_surname_range(self, start, end):
+        return self.client_rep_db.find_by_surname_range(start, end)
+
+    def replace_by_id(self, client_id, new_client):
+        new_id = self.client_rep_db.replace_by_id(client_id, new_client)
+        if self.cache is not None:
+            self.cache.invalidate(client_id)
+            self.cache.invalidate(new_id)
+        return new_id is not None
 
     def add_client(self, surname, name, patronymic, address, phone):
-        return self.client_rep_db.add_client(surname, name, patronymic, address, phone)
+        client_id = self.client_rep_db.add_client(surname, name, patronymic, address, phone)
+        if self.cache is not None:
+            self.cache.invalidate(client_id)
+        return client_id
+
+    def add_clients(self, clients, chunk_size=10000, use_copy=True):
+        client_ids = self.client_rep_db.add_clients(clients, chunk_size, use_copy)
+        if self.cache is not None:
+            for client_id in client_ids:
+                self.cache.invalidate(client_id)
+        return client_ids
+
+    def add_columns(self, batch):
+        client_ids = self.client_rep_db.add_rows(batch.iter_rows())
+        if self.cache is not None:
+            for client_id in client_ids:
+                self.cache.invalidate(client_id)
+        return client_ids
 
     def sort_by_field(self, field="surname"):
         return self.client_rep_db.sort_by_field(field)
 
     def delete_by_id(self, client_id):
-        query = "DELETE FROM clients WHERE client_id = %s"
-        with self.client_rep_db.conn.cursor() as cursor:
-            cursor.execute(query, (client_id,))
-            self.client_rep_db.conn.commit()
+        self.client_rep_db.delete_by_id(client_id)
+        if self.cache is not None:
+            self.cache.invalidate(client_id)
 
     def close(self):
         self.client_rep_db.close()
 
 
+class AsyncClientRepDB:
+    def __init__(self, db_name, user, password, host="localhost", port="5432", min_size=1, max_size=10):
+        self.db_name = db_name
+        self.user = user
+        self.password = password
+        self.host = host
+        self.port = port
+        self.min_size = min_size
+        self.max_size = max_size
+        self.pool = None
+
+    @classmethod
+    async def create(cls, db_name, user, password, host="localhost", port="5432", min_size=1, max_size=10):
+        repo = cls(db_name, user, password, host, port, min_size, max_size)
+        await repo.connect_to_db()
+        return repo
+
+    async def __aenter__(self):
+        if self.pool is None:
+            await self.connect_to_db()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def connect_to_db(self):
+        if asyncpg is None:
+            raise RuntimeError("AsyncClientRepDB requires the 'asyncpg' package.")
+        try:
+            self.pool = await asyncpg.create_pool(
+                database=self.db_name, user=self.user, password=self.password, host=self.host, port=int(self.port),
+                min_size=self.min_size, max_size=self.max_size
+            )
+        except Exception as e:
+            print(f"Error connecting to database: {e}")
+            raise
+        await self.create_table()
+
+    async def create_table(self, composite_index=False):
+        async with self.pool.acquire() as conn:
+            for statement in ClientRepDB.schema_statements(composite_index):
+                await conn.execute(statement)
+
+    @staticmethod
+    def row_to_client(row):
+        return Client._from_validated(surname=row["surname"], name=row["name"], patronymic=row["patronymic"],
+                                      address=row["address"], phone=row["phone"], client_id=row["client_id"])
+
+    async def read_all(self):
+        rows = await self.pool.fetch("SELECT * FROM clients")
+        return [self.row_to_client(row) for row in rows]
+
+    async def get_by_id(self, client_id):
+        row = await self.pool.fetchrow("SELECT * FROM clients WHERE client_id = $1", client_id)
+        if row:
+            return self.row_to_client(row)
+        else:
+            raise ValueError(f"Client with ID {client_id} not found")
+
+    async def add_client(self, surname, name, patronymic, address, phone):
+        query = "INSERT INTO clients (surname, name, patronymic, address, phone) VALUES ($1, $2, $3, $4, $5) RETURNING client_id"
+        return await self.pool.fetchval(query, surname, name, patronymic, address, phone)
+
+    async def sort_by_field(self, field="surname"):
+        if field not in ClientRepDB.SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort by field '{field}'. Allowed fields: {', '.join(ClientRepDB.SORTABLE_FIELDS)}")
+        order = f"COALESCE(\"{field}\", '')" if field in ClientRepDB.NULLABLE_FIELDS else f'"{field}"'
+        rows = await self.pool.fetch(f"SELECT * FROM clients ORDER BY {order}, client_id")
+        return [self.row_to_client(row) for row in rows]
+
+    async def delete_by_id(self, client_id):
+        await self.pool.execute("DELETE FROM clients WHERE client_id = $1", client_id)
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+
 if __name__ == "__main__":
     client_rep_json = ClientRepJson('clients.json')
 
@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from Cl2 import ClientRepDB, AsyncClientRepDB, ClientBatch
+
+DB_SETTINGS = dict(
+    db_name=os.environ.get("PGDATABASE", "postgres"),
+    user=os.environ.get("PGUSER", "postgres"),
+    password=os.environ.get("PGPASSWORD", ""),
+    host=os.environ.get("PGHOST", "localhost"),
+    port=os.environ.get("PGPORT", "5432"),
+)
+ROWS = 10000
+REQUESTS = 5000
+CONCURRENCY = 10
+
+
+def fill(db):
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("TRUNCATE clients RESTART IDENTITY")
+        conn.commit()
+    db.add_rows(ClientBatch(
+        ["Ivanov"] * ROWS, ["Ivan"] * ROWS, [""] * ROWS, ["Lenina 1"] * ROWS, ["+7-900-000-0001"] * ROWS
+    ).iter_rows())
+
+
+def run_sync(db, action):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(CONCURRENCY) as executor:
+        list(executor.map(action, range(REQUESTS)))
+    return time.perf_counter() - start
+
+
+async def run_async(action):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def limited(i):
+        async with semaphore:
+            await action(i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited(i) for i in range(REQUESTS)))
+    return time.perf_counter() - start
+
+
+def report(label, elapsed):
+    print(f"{label:<22} {elapsed:7.3f} s  {REQUESTS / elapsed:9.0f} req/s")
+
+
+async def main():
+    db = ClientRepDB(DB_SETTINGS["db_name"], DB_SETTINGS["user"], DB_SETTINGS["password"], DB_SETTINGS["host"],
+                     DB_SETTINGS["port"], maxconn=CONCURRENCY)
+    fill(db)
+    print(f"{REQUESTS} requests, {CONCURRENCY} in flight, {ROWS} rows")
+    report("sync get_by_id", run_sync(db, lambda i: db.get_by_id(i % ROWS + 1)))
+    report("sync add_client", run_sync(
+        db, lambda i: db.add_client("Petrov", "Petr", "", "Lenina 2", "+7-900-000-0002")
+    ))
+    async with AsyncClientRepDB(**DB_SETTINGS, max_size=CONCURRENCY) as repo:
+        report("async get_by_id", await run_async(lambda i: repo.get_by_id(i % ROWS + 1)))
+        report("async add_client", await run_async(
+            lambda i: repo.add_client("Petrov", "Petr", "", "Lenina 2", "+7-900-000-0002")
+        ))
+    fill(db)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
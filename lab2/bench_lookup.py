@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import random
+import tempfile
+from Cl2 import Client, ClientRepJson
+
+SIZES = (1000, 10000, 100000, 1000000)
+CALLS = 10000
+
+
+def make_repo(directory, size):
+    repo = ClientRepJson(os.path.join(directory, f"clients_{size}.json"), lazy=True)
+    repo.clients = [
+        Client._from_validated("Ivanov", "Ivan", "", "Lenina 1", "+7-900-000-0001", client_id)
+        for client_id in range(1, size + 1)
+    ]
+    repo.rebuild_index()
+    repo.last_id = size
+    return repo
+
+
+def per_call(action, client_ids):
+    start = time.perf_counter()
+    for client_id in client_ids:
+        action(client_id)
+    return (time.perf_counter() - start) / len(client_ids) * 1e6
+
+
+def main():
+    random.seed(0)
+    print(f"{'clients':>9} {'get_by_id':>11} {'replace':>11} {'delete':>11} {'list scan':>11}   (us per call)")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            repo = make_repo(directory, size)
+            client_ids = random.sample(range(1, size + 1), min(CALLS, size // 2))
+            lookup = per_call(repo.get_by_id, client_ids)
+            scan = per_call(
+                lambda client_id: next(client for client in repo.clients if client.get_client_id() == client_id),
+                client_ids[:100]
+            )
+            with repo.batch():
+                replace = per_call(
+                    lambda client_id: repo.replace_by_id(
+                        client_id, Client._from_validated("Petrov", "Petr", "", "Lenina 2", "+7-900-000-0002")
+                    ),
+                    client_ids
+                )
+                delete = per_call(repo.delete_by_id, client_ids)
+            print(f"{size:>9} {lookup:>11.2f} {replace:>11.2f} {delete:>11.2f} {scan:>11.2f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import threading
+from Cl2 import ClientRepDBAdapter, ClientBatch
+
+DB_SETTINGS = dict(
+    db_name=os.environ.get("PGDATABASE", "postgres"),
+    user=os.environ.get("PGUSER", "postgres"),
+    password=os.environ.get("PGPASSWORD", ""),
+    host=os.environ.get("PGHOST", "localhost"),
+    port=os.environ.get("PGPORT", "5432"),
+)
+ROWS = 10000
+THREADS = 16
+CALLS = 500
+
+
+def fill(adapter):
+    with adapter.client_rep_db.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("TRUNCATE clients RESTART IDENTITY")
+        conn.commit()
+    adapter.add_batch(ClientBatch(
+        ["Ivanov"] * ROWS, ["Ivan"] * ROWS, [""] * ROWS, ["Lenina 1"] * ROWS, ["+7-900-000-0001"] * ROWS
+    ))
+
+
+def lookups(adapter, seed):
+    db = adapter.client_rep_db
+    for i in range(CALLS):
+        db.get_by_id((seed * CALLS + i) % ROWS + 1)
+
+
+def run_threads(adapter):
+    threads = [threading.Thread(target=lookups, args=(adapter, seed)) for seed in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_nested(adapter):
+    db = adapter.client_rep_db
+    start = time.perf_counter()
+    for client in db.iter_all(batch_size=500):
+        db.get_by_id(client.get_client_id())
+    return time.perf_counter() - start
+
+
+def main():
+    fill(ClientRepDBAdapter(**DB_SETTINGS))
+    print(f"{THREADS} threads x {CALLS} get_by_id calls over {ROWS} rows")
+    for maxconn in (1, 4, 16):
+        adapter = ClientRepDBAdapter(**DB_SETTINGS, maxconn=maxconn)
+        elapsed = run_threads(adapter)
+        print(f"maxconn={maxconn:<3} {elapsed:7.3f} s  {THREADS * CALLS / elapsed:9.0f} calls/s")
+    elapsed = run_nested(ClientRepDBAdapter(**DB_SETTINGS, maxconn=1))
+    print(f"iter_all + get_by_id per row, maxconn=1: {elapsed:.3f} s for {ROWS} rows")
+
+
+if __name__ == "__main__":
+    sys.exit(main())